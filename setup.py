@@ -15,6 +15,7 @@ setup(
     packages=find_packages(include=["snapwell*"]),
     install_requires=[
         "libecl",
+        "numpy",
         "pydantic",
         "dataclasses>=0.6;python_version<'3.7'",
         "typing_extensions",
@@ -47,6 +48,5 @@ setup(
         "Topic :: Scientific/Engineering",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
-    setup_requires=["setuptools_scm"],
     include_package_data=True,
 )
@@ -33,7 +33,6 @@
 
 
 """
-from pkg_resources import DistributionNotFound, get_distribution
 
 __author__ = "PG Drange, K Flikka, and KW Kongsvik"
 __email__ = "pgdr@statoil.com"
@@ -43,11 +42,42 @@ __maintainer__ = "GBS IT SI SIB"
 __status__ = "Prototype"
 __credits__ = ["PG Drange", "K Flikka", "KW Kongsvik"]
 
-from .snapconfig import SnapConfig
-from .snapecl import findKeyword, findRestartStep, in_snap_mode, roundAwayFromEven, snap
-from .wellpath import WellPath, finiteFloat
+from importlib import import_module
+
+# The public names are imported on first access (PEP 562) so that loading
+# snapwell, e.g. for ERT plugin discovery, does not import libecl.
+_LAZY_ATTRIBUTES = {
+    "SnapConfig": ".snapconfig",
+    "findKeyword": ".snapecl",
+    "findRestartStep": ".snapecl",
+    "in_snap_mode": ".snapecl",
+    "roundAwayFromEven": ".snapecl",
+    "snap": ".snapecl",
+    "WellPath": ".wellpath",
+    "finiteFloat": ".wellpath",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 try:
-    __version__ = get_distribution(__name__).version
-except DistributionNotFound:
-    __version__ = "0.0.0"
+    from .version import version as __version__
+except ImportError:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        __version__ = version(__name__)
+    except PackageNotFoundError:
+        __version__ = "0.0.0"
@@ -1,15 +1,14 @@
 import os
-from pkg_resources import resource_filename
-from snapwell.snapwell_main import main as snapwell_main
 from ert.shared.plugins.plugin_manager import hook_implementation
 from ert.shared.plugins.plugin_response import plugin_response
 
+_RESOURCE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
 
 @hook_implementation
 @plugin_response(plugin_name="snapwell")
 def installable_jobs():
-    resource_directory = resource_filename("snapwell", "_ert_hooks")
-    return {"SNAPWELL": os.path.join(resource_directory, "SNAPWELL")}
+    return {"SNAPWELL": os.path.join(_RESOURCE_DIRECTORY, "SNAPWELL")}
 
 
 @hook_implementation
@@ -18,6 +17,8 @@ def job_documentation(job_name):
     if job_name != "SNAPWELL":
         return None
 
+    from snapwell.snapwell_main import main as snapwell_main
+
     return {
         "description": snapwell_main.__doc__,
         "examples": "",
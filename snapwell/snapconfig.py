@@ -15,14 +15,12 @@
 import logging
 from dataclasses import field
 from datetime import date
+from functools import cached_property
 from math import inf
 from os import path
 from pathlib import Path
 from typing import List, Optional
 
-from ecl.eclfile import EclFile
-from ecl.grid import EclGrid
-
 try:
     from pydantic.v1.dataclasses import dataclass
 except ImportError:
@@ -33,6 +31,14 @@ from typing_extensions import Literal
 from .wellpath import WellPath
 
 
+# the cached properties of SnapConfig, by the field naming the file they load
+_LOADED_FROM_FILE = {
+    "grid_file": "grid",
+    "restart_file": "restart",
+    "init_file": "init",
+}
+
+
 class SnapWellConfig:
     validate_all = True
     validate_assignment = True
@@ -71,27 +77,62 @@ class SnapConfig:
 
     def set_base_path(self, new_base):
         """
-        sets the base path for relative paths in the config.
+        sets the base path for relative paths in the config.  A grid, restart
+        or init loaded from a path that changes is read again on next access.
         """
-        if not self.grid_file.is_absolute():
-            self.grid_file = Path(new_base).joinpath(self.grid_file)
-        if not self.restart_file.is_absolute():
-            self.restart_file = Path(new_base).joinpath(self.restart_file)
+        for name, loaded in _LOADED_FROM_FILE.items():
+            file_path = getattr(self, name)
+            if file_path is not None and not file_path.is_absolute():
+                setattr(self, name, Path(new_base).joinpath(file_path))
+                self.__dict__.pop(loaded, None)
         if not self.output_dir.is_absolute():
             self.output_dir = Path(new_base).joinpath(self.output_dir)
-        if self.init_file is not None and not self.init_file.is_absolute():
-            self.init_file = Path(new_base).joinpath(self.init_file)
 
         for wpf in self.wellpath_files:
             if not wpf.well_file.is_absolute():
                 wpf.well_file = Path(new_base).joinpath(wpf.well_file)
 
+    def clear_cache(self):
+        """
+        forgets the loaded grid, restart and init so that they are read again
+        from file on next access.  Call this after assigning grid_file,
+        restart_file or init_file.
+        """
+        for name in _LOADED_FROM_FILE.values():
+            self.__dict__.pop(name, None)
+
+    def __getstate__(self):
+        """
+        the loaded grid, restart and init are not pickled, they are read again
+        from file when accessed after unpickling.
+        """
+        state = self.__dict__.copy()
+        for name in _LOADED_FROM_FILE.values():
+            state.pop(name, None)
+        return state
+
     @property
     def wellpaths(self):
-        logging.info("Loading %d wells", len(self.wellpath_files))
+        return list(self.iter_wellpaths())
+
+    def iter_wellpaths(self, errors=None):
+        """
+        reads and yields the wellpaths one at a time, so that only the one
+        being processed needs to be kept in memory.
 
-        def read_wellpath_file(wpf):
-            wp = WellPath.parse(str(wpf.well_file), date=wpf.date)
+        If errors is a list, a wellpath file that cannot be read is logged,
+        noted in errors and skipped, otherwise the error is raised.
+        """
+        logging.info("Loading %d wells", len(self.wellpath_files))
+        for wpf in self.wellpath_files:
+            try:
+                wp = WellPath.parse(str(wpf.well_file), date=wpf.date)
+            except (IOError, ValueError, IndexError) as err:
+                if errors is None:
+                    raise
+                logging.error("while reading well path: %s", err)
+                errors.append(f"Failed to read well path: {wpf.well_file}")
+                continue
             if (
                 wp.well_name
                 and len(wp.well_name) > 1
@@ -106,20 +147,28 @@ class SnapConfig:
 
             wp.owc_definition = wpf.owc_definition
             wp.owc_offset = wpf.owc_offset
-            logging.info("(%d points, %d logs)", len(wp), len(wp.headers))
-            logging.info("done")
-            return wp
-
-        return [read_wellpath_file(wpf) for wpf in self.wellpath_files]
+            logging.info(
+                "Loaded %s (%d points, %d logs)",
+                wpf.well_file,
+                len(wp),
+                len(wp.headers),
+            )
+            yield wp
 
-    @property
+    @cached_property
     def grid(self):
+        from ecl.grid import EclGrid
+
         return EclGrid(str(self.grid_file))
 
-    @property
+    @cached_property
     def restart(self):
+        from ecl.eclfile import EclFile
+
         return EclFile(str(self.restart_file))
 
-    @property
+    @cached_property
     def init(self):
+        from ecl.eclfile import EclFile
+
         return EclFile(str(self.init_file))
@@ -14,7 +14,12 @@
 
 
 import logging
-from math import inf, nan, sqrt
+from bisect import bisect_right
+from collections import namedtuple
+from math import copysign, hypot, inf, nan
+from weakref import WeakKeyDictionary
+
+import numpy as np
 
 from .snapconfig import OwcDefinition
 
@@ -25,7 +30,7 @@ def dist(p1, p2):
     dimensionality, we pick the min(len(p1), len(p2)) first points of each
     coordinate.
     """
-    return sqrt(sum([(e[0] - e[1]) ** 2 for e in zip(p1, p2)]))
+    return hypot(*(a - b for a, b in zip(p1, p2)))
 
 
 def roundAwayFromEven(val):
@@ -37,37 +42,52 @@ def roundAwayFromEven(val):
     integers.
     """
     epsilon = 0.1
-    r = val % 2.0
-    if r < epsilon:
-        return round(val) + epsilon
-    if r > (2.0 - epsilon):
-        return round(val) - epsilon
+    nearest_even = 2.0 * round(0.5 * val)
+    diff = val - nearest_even
+    if abs(diff) < epsilon:
+        return nearest_even + copysign(epsilon, diff)
     return val
 
 
+class _RestartDates:
+    """Read-only sequence view of the report step dates in a restart file.
+
+    Dates are fetched from the restart file on access, so that bisecting
+    the view only reads O(log n) report steps.
+    """
+
+    def __init__(self, restart):
+        self._restart = restart
+
+    def __len__(self):
+        return self._restart.num_report_steps()
+
+    def __getitem__(self, step):
+        return self._restart.iget_restart_sim_time(step).date()
+
+
 def findRestartStep(restart, date):
     """
     Finds the last restart step in the given restart file before the given date
     """
-    # start at 1, since we return step - 1
-    for step in range(1, restart.num_report_steps()):
-        new_date = restart.iget_restart_sim_time(step).date()  # step date
-        if new_date > date:
-            return step - 1
-
-    # did not find it, return len - 1
-    return step
+    # report step dates are increasing, start at 1, since we return step - 1
+    return bisect_right(_RestartDates(restart), date, 1) - 1
 
 
 def findKeyword(kw, restart, date, step=None):
     """Find and return kw (EclKW) from restart file at the last step before given
-    date.
+    date.  Each keyword is read once per report step and restart file.
     """
     if not step:
         step = findRestartStep(restart, date)
     if not (0 <= step < restart.num_report_steps()):
         raise ValueError("restart step out of range 0 <= %d < steps" % step)
-    return restart.iget_named_kw(kw, step)
+    # kept on the restart file itself, as the keywords refer back to it, so
+    # the cache goes away along with the file
+    keywords = vars(restart).setdefault("_snapwell_keywords", {})
+    if (kw, step) not in keywords:
+        keywords[kw, step] = restart.iget_named_kw(kw, step)
+    return keywords[kw, step]
 
 
 def in_snap_mode(already_in_snap_mode, well_path, idx):
@@ -82,67 +102,161 @@ def in_snap_mode(already_in_snap_mode, well_path, idx):
 
     Raises Value Error if the well path depth type is not set correctly.
     """
-    if already_in_snap_mode or not well_path.depth_type:
+    if already_in_snap_mode:
         return True
-    if well_path.depth_type not in well_path:
+    depth_type = well_path.depth_type
+    if not depth_type:
+        return True
+    if depth_type not in well_path:
         raise ValueError(
-            f"Well path {well_path} does not contain given depth type: {well_path.depth_type}"
+            f"Well path {well_path} does not contain given depth type: {depth_type}"
         )
 
-    return well_path[well_path.depth_type][idx] > well_path.window_depth
-
-
-def _activeIdx(grid, i, j, k):
-    """Get the active index corresponding to grid coordinate i, j, k.  Or -1."""
-    if min(i, j, k) < 0:
-        return -1
-    return grid.get_active_index(ijk=(i, j, k))
+    return well_path[depth_type][idx] > well_path.window_depth
 
 
-_snap_prev_ijk = None
+def _snap_mode_start(well_path):
+    """Returns the index of the first row of well_path in snap mode, see
+    in_snap_mode, or the number of rows if snap mode is never entered."""
+    if not well_path.depth_type or not len(well_path):
+        return 0
+    in_snap_mode(False, well_path, 0)  # raises if depth type is not set correctly
+    depths = np.asarray(well_path[well_path.depth_type], dtype=np.float64)
+    below_window = depths > well_path.window_depth
+    return int(below_window.argmax()) if below_window.any() else len(depths)
 
 
-def _ijk(grid, x, y, z):
-    """Get i,j,k for x,y,z in grid"""
-    global _snap_prev_ijk
-
-    ijk = grid.find_cell(x, y, z, start_ijk=_snap_prev_ijk)
+def _ijk(grid, x, y, z, start_ijk=None):
+    """Get i,j,k for x,y,z in grid.  The search starts from start_ijk, typically
+    the cell of the previous point along the well, if given."""
+    ijk = grid.find_cell(x, y, z, start_ijk=start_ijk)
     if not ijk:
         k = 0
         i, j = grid.findCellXY(x, y, 0)
         ijk = (i, j, k)
-
-    _snap_prev_ijk = ijk
     return ijk
 
 
-def active_cell_column(grid, owc_kw, x, y, z):
-    """Let i,j,k be the cell containing x,y,z.  This function returns a list of
-    the active cells in the (i,j)-column
+def _values(kw):
+    """Returns the values of the keyword kw as a numpy array.  EclKW values are
+    viewed without copying."""
+    if hasattr(kw, "numpy_view"):
+        return kw.numpy_view()
+    return np.asarray(kw)
+
+
+def _active_index_grid(grid):
+    """Returns an (nx, ny, nz) array of the active index of every cell in the
+    grid, with -1 for inactive cells.
+    """
+    nx, ny, nz = grid.getNX(), grid.getNY(), grid.getNZ()
+    active = grid.export_actnum().numpy_copy() > 0
+    active_index = np.where(active, np.cumsum(active, dtype=np.int32) - 1, -1)
+    # cells are stored with i running fastest, then j, then k
+    return np.ascontiguousarray(active_index.reshape(nz, ny, nx).transpose())
+
+
+_GridLocator = namedtuple(
+    "_GridLocator", ["active_index", "cell_z", "buckets", "origin", "bucket_size"]
+)
+
+# locators of the grids seen so far
+_grid_locators = WeakKeyDictionary()
+
+
+def _grid_locator(grid):
+    """Returns the _GridLocator of grid, built once per grid.  It holds the
+    active index of every cell (see _active_index_grid), the cell center z
+    value of every active cell, indexed by active index, and the xy buckets
+    of the columns, see _column_buckets."""
+    if grid not in _grid_locators:
+        index = grid.export_index(active_only=True)
+        centers = grid.export_position(index)
+        columns = index[["i", "j"]].to_numpy()
+        _grid_locators[grid] = _GridLocator(
+            _active_index_grid(grid),
+            centers[:, 2].copy(),
+            *_column_buckets(grid.getNX(), grid.getNY(), columns, centers[:, :2]),
+        )
+    return _grid_locators[grid]
 
-        [(i,j,n_z,an_z,sn_z), (i,j,n_z-1,an_z-1,sn_z-1), ..., (i,j,0,a0,s0)],
 
-    where n_z is the height of the grid, at is the active index of the t'th
-    cell in the list and st its s owc_kw.
+def _bucket(xy, origin, bucket_size, shape):
+    """The index of the bucket containing each xy, clamped to the buckets."""
+    return np.clip((xy - origin) // bucket_size, 0, np.subtract(shape, 1)).astype(int)
 
-    In the case where there is no cell found containing xyz, this function
-    will return [].
 
+def _column_buckets(nx, ny, columns, xy):
+    """Divides the xy extent of the active cells into nx*ny buckets, and
+    returns (buckets, origin, bucket_size), where buckets holds for each bucket
+    the i*ny+j of an active column with a cell center in it, or -1.  For a
+    regular grid each bucket covers a column.
     """
-    col = []
+    buckets = np.full((nx, ny), -1, dtype=np.int32)
+    if not len(xy):
+        return buckets, np.zeros(2), np.ones(2)
+    low, high = xy.min(axis=0), xy.max(axis=0)
+    bucket_size = (high - low) / (max(nx - 1, 1), max(ny - 1, 1))
+    bucket_size[bucket_size == 0] = 1.0
+    origin = low - bucket_size / 2
+    bx, by = _bucket(xy, origin, bucket_size, (nx, ny)).T
+    buckets[bx, by] = columns[:, 0] * ny + columns[:, 1]
+    return buckets, origin, bucket_size
+
+
+def _start_cell(grid, x, y, z):
+    """Returns an i,j,k close to x,y,z, to start grid.find_cell from, or None
+    if there is no active cell in the xy bucket of x,y.  The column is looked
+    up in the buckets of the grid's _GridLocator, and k is its active cell
+    with center closest to z.  Without a starting point grid.find_cell
+    searches the whole grid."""
+    locator = _grid_locator(grid)
+    bx, by = _bucket(
+        np.array([x, y]), locator.origin, locator.bucket_size, locator.buckets.shape
+    )
+    column = int(locator.buckets[bx, by])
+    if column < 0:
+        return None
+    i, j = divmod(column, locator.buckets.shape[1])
+    active = locator.active_index[i, j]
+    ks = np.flatnonzero(active >= 0)
+    k = ks[np.abs(locator.cell_z[active[ks]] - z).argmin()]
+    return i, j, int(k)
+
 
+Column = namedtuple("Column", ["i", "j", "ks", "active_indices", "values", "zs"])
+Column.__doc__ = """The active cells of the (i,j)-column of a grid, ordered from the
+bottom (k=nz-1) and up.  ks, active_indices, values and zs are arrays holding
+the layer, the active index, the owc keyword value and the cell center z
+value of each cell."""
+
+
+def active_cell_column(grid, owc_kw, x, y, z):
+    """Let i,j,k be the cell containing x,y,z.  This function returns the
+    Column of active cells in the (i,j)-column, from k=n_z-1 and up to k=0,
+    where n_z is the height of the grid.
+
+    In the case where there is no active cell in the column, the arrays of
+    the returned Column are empty.
+    """
+    locator = _grid_locator(grid)
     i, j, _ = _ijk(grid, x, y, z)
-    nz = grid.getNZ()
-    for k_idx in range(nz - 1, -1, -1):  # backwards from nz-1 to 0
-        a = _activeIdx(grid, i, j, k_idx)
-        if a >= 0:
-            s = owc_kw[a]
-            col.append((i, j, k_idx, a, s))
-    return col
+    return _column(locator.active_index, locator.cell_z, _values(owc_kw), i, j)
+
 
+def _column(active_index, cell_z, owc_values, i, j):
+    """Returns the Column of active cells in the (i,j)-column, see
+    active_cell_column."""
+    column = active_index[i, j, ::-1]  # backwards from nz-1 to 0
+    is_active = column >= 0
+    ks = np.arange(len(column) - 1, -1, -1)[is_active]
+    acts = column[is_active]
+    values = owc_values[acts].astype(np.float64)
+    return Column(i, j, ks, acts, values, cell_z[acts])
 
-def interpolate(grid, k_above, col, thresh):
-    """Interpolates.  Takes grid, a index, the activeCellColumn and a threshold.
+
+def interpolate(k_above, col, thresh):
+    """Interpolates.  Takes a index, the activeCellColumn and a threshold.
 
     Returns owc given that k_above is index of first cell whose center is
     above owc.
@@ -153,19 +267,17 @@ def interpolate(grid, k_above, col, thresh):
     k_below = k_above - 1
     if k_below < 0:
         raise IndexError("Cannot interpolate down from bottom cell.")
-    active_idx_below = col[k_below][3]
-    active_idx_above = col[k_above][3]  # col contains cell from bottom and up
-
-    swat_below = col[k_below][4]  # the SWAT/SGAS/etc in cell above and below OWC
-    swat_above = col[k_above][4]
+    # the SWAT/SGAS/etc in cell above and below OWC, col is from bottom and up
+    swat_below = col.values[k_below]
+    swat_above = col.values[k_above]
 
     norm_swat_above = swat_below - swat_above
     norm_swat_thresh = swat_below - thresh
     norm_swat_ratio = 1 - (norm_swat_thresh / norm_swat_above)
 
     # z coordinate of cell gives height
-    z_above = grid.get_xyz(active_index=active_idx_above)[2]
-    z_below = grid.get_xyz(active_index=active_idx_below)[2]
+    z_above = col.zs[k_above]
+    z_below = col.zs[k_below]
     z_diff = abs(z_above - z_below)  # distance between cell centers
 
     owc = z_above + z_diff * norm_swat_ratio
@@ -175,51 +287,51 @@ def interpolate(grid, k_above, col, thresh):
 
 def first_swat_below_treshold(column, threshold=0.7):
     """
-    finds the first (i,j,k,a,swat) tuple with swat less than treshold.
-    If there is no such tuple, returns None.
-    :param column: List of (x,y,z,a,swat) tuples.
+    finds the index of the first cell in the column with swat less than
+    treshold.  If there is no such cell, returns None.
+    :param column: Column of active cells.
     """
-    for idx, (_, _, _, _, swat) in enumerate(column):
-        if swat < (threshold + 0.0001):
-            return idx
-    return None
+    below = column.values < (threshold + 0.0001)
+    if not below.any():
+        return None
+    return int(below.argmax())
 
 
-def interpolate_owc(grid, col, k_above_owc, threshold=0.7):
+def interpolate_owc(col, k_above_owc, threshold=0.7):
     """
     This function returns  the approximate
     (linear interpolated) OWC for (x,y).
 
-    :param col: List of (i,j,k,a,s) tuples to interpolate over.
-    :param grid: The grid the column belongs to.
+    :param col: Column of active cells to interpolate over.
     :param k_above_owc:index of first cell whose center is above owc.
     """
-
-    active_idx = col[k_above_owc][3]  # col[idx] contains x,y,z,a,s
-
     if k_above_owc > 0:
-        return interpolate(grid, k_above_owc, col, threshold)
+        return interpolate(k_above_owc, col, threshold)
 
-    return grid.get_xyz(active_index=active_idx)[2]
+    return col.zs[k_above_owc]
 
 
-def find_center_z(grid, column, height):
+def find_center_z(column, height):
     """
-    Given list of (i,j,k,a,swat) tuples giving indecies of active cells in
-    the grid. Returns the center point z value of a cell in the grid above the
-    given height.  Returns None if cell center above the last column center
+    Given a Column of active cells in the grid, returns the center point z
+    value of a cell in the grid above the given height.  Returns None if cell
+    center above the last column center
     """
-    for (_, _, _, active_idx, _) in column:
-        cell_center_height = grid.get_xyz(active_index=active_idx)[2]
-        if height >= cell_center_height:
-            return cell_center_height
-    return None
+    below = height >= column.zs
+    if not below.any():
+        return None
+    return column.zs[below.argmax()]
 
 
 def find_owc(grid, owc_kw, x, y, z, threshold=0.7, owc_offset=0.5):
     """Given a grid, owc_kw, x, y, z, find the OWC Z s.t. owc_kw(x,y,Z)=thresh."""
     col = active_cell_column(grid, owc_kw, x, y, z)
-    if not col:
+    return _find_column_owc(col, owc_kw, x, y, z, threshold, owc_offset)
+
+
+def _find_column_owc(col, owc_kw, x, y, z, threshold, owc_offset):
+    """find_owc for the Column col of active cells below x, y, z."""
+    if not col.active_indices.size:
         logging.warning(
             "No active cell for %s at (%f, %f, %f), owc is nan", owc_kw, x, y, z
         )
@@ -235,8 +347,8 @@ def find_owc(grid, owc_kw, x, y, z, threshold=0.7, owc_offset=0.5):
         )
         return nan, z
     # snap to first cell center above 'owc_exact - owc_offset'
-    owc_exact = interpolate_owc(grid, col, threshold_idx, threshold=threshold)
-    cell_center = find_center_z(grid, col, owc_exact - owc_offset)
+    owc_exact = interpolate_owc(col, threshold_idx, threshold=threshold)
+    cell_center = find_center_z(col, owc_exact - owc_offset)
     if cell_center is None:
         logging.warning(
             "Depth is above active cells for %s at (%f, %f, %f), using depth from last active cell",
@@ -245,11 +357,19 @@ def find_owc(grid, owc_kw, x, y, z, threshold=0.7, owc_offset=0.5):
             y,
             z,
         )
-        return owc_exact, grid.get_xyz(active_index=col[-1][3])[2]
+        return owc_exact, col.zs[-1]
 
     return owc_exact, cell_center
 
 
+def _column_cell(col, z):
+    """Returns the i,j,k of the cell in col with its center closest to depth z,
+    or None if the column has no active cells."""
+    if not col.zs.size:
+        return None
+    return col.i, col.j, int(col.ks[np.abs(col.zs - z).argmin()])
+
+
 def snap(
     well_path,
     grid,
@@ -303,17 +423,11 @@ def snap(
 
     # pick out swat/sgas/etc info for given step
     owc_kw = findKeyword(owc_definition.keyword, rest, date)
-
-    logs = {
-        "TVD_DIFF": [],  # TVD_DIFF
-        "OLD_TVD": [],  # OLD_TVD
-        "PERMX": [],  # PERMX --- if INIT file is specified
-        "OWC": [],  # OWC --- Approximate OWC for given (x,y)
-        "LENGTH": [],  # XY-length from previous wellpoint (2D)
-        "SWAT": [],  # SWAT of result
-        "SGAS": [],  # SGAS of result
-        "SOIL": [],  # 1 - (SGAS+SWAT)
-    }
+    locator = _grid_locator(grid)
+    active_index = locator.active_index
+    cell_z = locator.cell_z
+    owc_values = _values(owc_kw)
+    columns = {}  # the active cell columns snapped in so far, by (i,j)
 
     snap_mode = False  # set to true below when we start optimizing more
     #                   specifically, set to true when three points in the input
@@ -327,21 +441,42 @@ def snap(
     if "SGAS" in keywords or "SOIL" in keywords:
         sgas = findKeyword("SGAS", rest, date)
 
+    # a copy, the well path itself is updated along the way
+    xyz = np.column_stack([well_path["x"], well_path["y"], well_path["z"]])
+    points = xyz.tolist()
+    old_tvds = xyz[:, 2]
+    new_tvds = old_tvds.copy()
+    owcs = np.full(len(points), nan)
+    cells = np.full(len(points), -1)  # active index of each new point, or -1
+    # XY-length from previous wellpoint (2D)
+    lengths = np.zeros(len(points))
+    lengths[1:] = np.hypot(np.diff(xyz[:, 0]), np.diff(xyz[:, 1]))
+    # the MD column, updated in place along with the depths
+    mds = well_path["MD"] if "MD" in well_path.headers else None
+
+    snap_start = _snap_mode_start(well_path)
     snapped_idx = 0
-    for idx, (x, y, z, *_) in enumerate(well_path):
-        logs["OLD_TVD"].append(z)
+    # cell of the previous point, where the next cell search starts
+    ijk = None
+    if points:
+        ijk = _start_cell(grid, *points[0])
+    for idx, (x, y, z) in enumerate(points):
         new_tvd = z
         owc_exact = nan
         z_range = (-inf, inf)
+        col = None
 
         # Ready to enter snap mode?
-        new_mode = in_snap_mode(snap_mode, well_path, idx)
-        if new_mode and not snap_mode:
+        if idx == snap_start:
             logging.info(
-                f"Enabling snap mode at point {idx} (depth {z}), "
-                f"depth type: {well_path.depth_type} window path: {well_path.window_depth}"
+                "Enabling snap mode at point %d (depth %s), "
+                "depth type: %s window path: %s",
+                idx,
+                z,
+                well_path.depth_type,
+                well_path.window_depth,
             )
-            snap_mode = new_mode
+            snap_mode = True
 
         #
         # Step 1.  If snap mode, find owc_exact (interpolated) and let
@@ -350,14 +485,12 @@ def snap(
         #
         if snap_mode:
             snapped_idx += 1
-            owc_exact, new_tvd = find_owc(
-                grid,
-                owc_kw,
-                x,
-                y,
-                z,
-                threshold=c_owc_definition,
-                owc_offset=c_owc_offset,
+            i, j, _ = _ijk(grid, x, y, z, start_ijk=ijk)
+            if (i, j) not in columns:
+                columns[i, j] = _column(active_index, cell_z, owc_values, i, j)
+            col = columns[i, j]
+            owc_exact, new_tvd = _find_column_owc(
+                col, owc_kw, x, y, z, c_owc_definition, c_owc_offset
             )
 
         #
@@ -367,12 +500,8 @@ def snap(
         #          than the (x,y) distances times delta.
         #
         if snap_mode and idx > 1:  # caring about delta at this point
-            prev_wp = well_path[idx - 1]
-            x2, y2 = prev_wp[0], prev_wp[1]
-            d = dist(
-                (x, y), (x2, y2)
-            )  # the projected distance between prev point and this
-            prev_z = prev_wp[2]
+            d = lengths[idx]  # the projected distance between prev point and this
+            prev_z = new_tvds[idx - 1]
             if snapped_idx > 1:
                 zp = prev_z + d * delta  # previous z plus  max elevation
                 zm = prev_z - d * delta  # previous z minus max elevation
@@ -387,11 +516,17 @@ def snap(
 
         # END OF WELLPOINT ITERATIONS
 
-        # Now we add this row's values on to the columns: perm, owc, length, old_tvd, diff etc.
-        logs["TVD_DIFF"].append(new_tvd - z)
+        new_tvds[idx] = new_tvd
+        owcs[idx] = owc_exact
         well_path[idx] = (x, y, new_tvd)
-        i, j, k = _ijk(grid, x, y, new_tvd)
-        new_cell = _activeIdx(grid, i, j, k)  # Active index of (i,j,k), or -1
+        # the new point is in, or next to, a cell of the column we snapped in
+        if col is not None:
+            ijk = _column_cell(col, new_tvd) or ijk
+        ijk = _ijk(grid, x, y, new_tvd, start_ijk=ijk)
+        i, j, k = ijk
+        # Active index of (i,j,k), or -1
+        new_cell = active_index[i, j, k] if (i | j | k) >= 0 else -1
+        cells[idx] = new_cell
 
         if new_cell < 0 and snap_mode:
             logging.warning(
@@ -403,51 +538,37 @@ def snap(
                 y,
                 new_tvd,
             )
-        permx = nan
-        if permx_kw and new_cell >= 0:
-            permx = permx_kw[new_cell]
-        logs["PERMX"].append(permx)
-
-        # SWAT, SGAS, SOIL
-        swat_val, sgas_val, soil_val = nan, nan, nan
-        if "SWAT" in keywords and new_cell >= 0:
-            swat_val = swat[new_cell]
-        logs["SWAT"].append(swat_val)
-
-        if "SGAS" in keywords and new_cell >= 0:
-            sgas_val = sgas[new_cell]
-        logs["SGAS"].append(sgas_val)
-
-        if "SOIL" in keywords and new_cell >= 0:
-            soil_val = swat[new_cell] + sgas[new_cell]
-        logs["SOIL"].append(1 - soil_val)
-
-        logs["OWC"].append(owc_exact)
-        if idx > 0:
-            prev_wp = well_path[idx - 1]
-            x2, y2, z2 = prev_wp[0], prev_wp[1], prev_wp[2]
-            length = dist((x, y), (x2, y2))
-            logs["LENGTH"].append(length)
-            if "MD" in well_path.headers and snap_mode:
-                true_length = dist((x, y, new_tvd), (x2, y2, z2))
-                prev_md = well_path["MD"][idx - 1]
-                new_md = prev_md + true_length
-                well_path["MD"][idx] = new_md
-        else:
-            logs["LENGTH"].append(0)
-
-    recognized_kw = (
-        "LENGTH",
-        "TVD_DIFF",
-        "OLD_TVD",
-        "OWC",
-        "PERMX",
-        "SWAT",
-        "SGAS",
-        "SOIL",
-    )
+        if idx > 0 and mds is not None and snap_mode:
+            x2, y2, z2 = xyz[idx - 1, 0], xyz[idx - 1, 1], new_tvds[idx - 1]
+            true_length = hypot(x - x2, y - y2, new_tvd - z2)
+            mds[idx] = mds[idx - 1] + true_length
+
+    # Now we make the columns: perm, owc, length, old_tvd, diff etc.
+    is_active = cells >= 0
+
+    def cell_values(kw):
+        """Values of kw in the cell of each new point, nan if inactive.  Each
+        keyword is only read for the active cells."""
+        values = np.full(len(cells), nan)
+        if kw is not None:
+            values[is_active] = _values(kw)[cells[is_active]]
+        return values
+
+    # PERMX only if INIT file is specified, and only read when asked for
+    permx = permx_kw if permx_kw and "PERMX" in keywords else None
+    logs = {
+        "TVD_DIFF": new_tvds - old_tvds,
+        "OLD_TVD": old_tvds,
+        "PERMX": cell_values(permx),
+        "OWC": owcs,  # Approximate OWC for given (x,y)
+        "LENGTH": lengths,
+        "SWAT": cell_values(swat),  # SWAT of result
+        "SGAS": cell_values(sgas),  # SGAS of result
+    }
+    logs["SOIL"] = 1 - (logs["SWAT"] + logs["SGAS"])
+
     for kw in keywords:
-        if kw in recognized_kw:
+        if kw in logs:
             well_path.add_column(kw, logs[kw])
         else:
             logging.warning('Unrecognized keyword "%s".  Ignoring', kw)
@@ -17,11 +17,20 @@ import argparse
 import logging
 import sys
 import warnings
-from os import makedirs, path
-from time import time
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy, deepcopy
+from functools import lru_cache
+from os import makedirs, path, stat
+from stat import S_ISREG
+from time import perf_counter
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from snapwell import __version__ as VERSION
 from snapwell import snap
 from snapwell.snapconfig import OwcDefinition, SnapConfig
@@ -37,31 +46,50 @@ def percentage(value):
     raise argparse.ArgumentTypeError(f"Value must be in range [0, 100] {value}")
 
 
+def positive_int(value):
+    try:
+        value = int(value)
+    except (ValueError, TypeError):
+        raise argparse.ArgumentTypeError(f"Value must be integer {value}")
+    if value >= 1:
+        return value
+    raise argparse.ArgumentTypeError(f"Value must be at least 1 {value}")
+
+
 class DuplicateFilter(logging.Filter):
+    def __init__(self, name=""):
+        super().__init__(name)
+        self.last_log = None
+        self.log_count = 0
+
     def filter(self, record):
         # add other fields if you need more granular comparison, depends on your app
         current_log = (record.module, record.levelno, record.msg)
-        log_count = getattr(self, "log_count", 0)
-        if current_log != getattr(self, "last_log", None):
-            if log_count > 1:
+        if current_log != self.last_log:
+            if self.log_count > 1:
                 print(f"Suppressed {self.log_count} similar messages")
             self.last_log = current_log
             self.log_count = 1
             return True
-        else:
-            log_count = getattr(self, "log_count", 0)
-            self.log_count = log_count + 1
 
+        self.log_count += 1
         return False
 
     def reset_count(self):
         self.last_log = None
-        log_count = getattr(self, "log_count", 0)
-        if log_count > 1:
+        if self.log_count > 1:
             print(f"Suppressed {self.log_count} similar messages")
         self.log_count = 0
 
 
+@lru_cache(maxsize=8)
+def _load_yaml(conf_file, mtime):
+    """Returns the contents of the yaml file conf_file.  The modification time
+    mtime is part of the cache key, so the file is read again if changed."""
+    with open(conf_file, "rb") as config_stream:
+        return yaml.load(config_stream, Loader=SafeLoader)
+
+
 def warn_without_traceback(message, category, filename, lineno, file=None, line=None):
 
     log = file if hasattr(file, "write") else sys.stderr
@@ -76,18 +104,19 @@ class ParserPrintHelp(argparse.ArgumentParser):
 
 
 class SnapwellRunner:
-    def __init__(self, config, grid, restart, permx, wellpaths, resinsight):
+    def __init__(self, config, grid, restart, permx, wellpaths, resinsight, jobs=1):
         self.config = config
         self.grid = grid
         self.restart = restart
         self.permx = permx
         self.wellpaths = wellpaths
         self.resinsight = resinsight
+        self.jobs = jobs
         self.errors = []
 
     def run_and_write(self, wp):
         if not self.config.output_dir.exists():
-            makedirs(str(self.config.output_dir))
+            makedirs(str(self.config.output_dir), exist_ok=True)
         try:
             # call to main algorithm
             snap(
@@ -114,23 +143,77 @@ class SnapwellRunner:
             self.errors.append("Failed to write well path: {}".format(wp.file_name))
 
     def main_loop(self):
-        num_snaps = len(self.wellpaths)
+        num_snaps = len(self.config.wellpath_files)
         logging.info("delta_z    = %.3f", self.config.delta_z)
         logging.info("owc_offset = %.3f", self.config.owc_offset)
         owc_def = self.config.owc_definition
         logging.info("owc_defini = %.3f (%s)", owc_def.value, owc_def.keyword)
         logging.info("output     = %s", self.config.output_dir)
+        if self.jobs > 1:
+            # each worker process loads its own grid, restart and init
+            with ProcessPoolExecutor(
+                max_workers=self.jobs,
+                initializer=_init_worker,
+                initargs=(self.config, self.resinsight),
+            ) as pool:
+                wellpaths = list(self.wellpaths)
+                # longest wells first, so no long well is left running alone
+                # at the end, snap errors are still reported in input order
+                order = sorted(range(len(wellpaths)), key=lambda i: -len(wellpaths[i]))
+                results = pool.map(_run_and_write, [wellpaths[i] for i in order])
+                errors = dict(zip(order, results))
+                for i in range(len(wellpaths)):
+                    self.errors.extend(errors[i])
+            return
         for i, wp in enumerate(self.wellpaths):
             sep = "=" * 79
             logging.info("\n\n%s", sep)
             logging.info("%d/%d \t Snapping %s", i + 1, num_snaps, wp.well_name)
-            start = time()
+            start = perf_counter()
             self.run_and_write(wp)
-            stop = time()
+            stop = perf_counter()
             sec = round(stop - start, 2)
             logging.info("Operation took %s seconds", str(sec))
 
 
+# the SnapwellRunner of a worker process, see SnapwellRunner.main_loop
+_worker_runner = None
+
+
+def _init_worker(config, resinsight):
+    """Loads the grid, restart and PERMX of config in a worker process.
+
+    A forked worker gets the config with the grid already loaded by the
+    parent, and shares its memory copy-on-write instead of loading another
+    copy.  The restart and INIT files are opened anew, as reading the
+    parent's open files would move their (shared) file offsets.
+    """
+    global _worker_runner
+    grid = config.grid
+    config = copy(config)  # forgets the loaded files, see SnapConfig
+    permx = None
+    if "PERMX" in config.log_keywords:
+        permx = config.init.iget_named_kw("PERMX", 0)
+    _worker_runner = SnapwellRunner(config, grid, config.restart, permx, [], resinsight)
+
+
+def _run_and_write(wp):
+    """Snaps and writes wp in a worker process, returns the errors."""
+    _worker_runner.errors = []
+    logging.info("Snapping %s", wp.well_name)
+    _worker_runner.run_and_write(wp)
+    return _worker_runner.errors
+
+
+# command line arguments which, when given, override the config field
+_OVERRIDES = (
+    ("owc_offset", "owc_offset"),
+    ("overwrite", "overwrite"),
+    ("owc_definition", "owc_definition"),
+    ("delta", "delta_z"),
+)
+
+
 class SnapwellApp:
     def __init__(self, argv):
         self.parser = self.make_parser(argv[0])
@@ -140,8 +223,6 @@ class SnapwellApp:
         args = self.args
         snap_conf = args.config
 
-        if args.owc_offset:
-            snap_conf.owc_offset = args.owc_offset
         if args.output:
             outpath = path.abspath(args.output)
             if path.isfile(outpath):
@@ -149,14 +230,10 @@ class SnapwellApp:
                     "Output path is an existing file. Delete it or choose a different output path."
                 )
             snap_conf.output_dir = outpath
-        if args.overwrite:
-            snap_conf.overwrite = args.overwrite
-        if args.owc_definition:
-            snap_conf.owc_definition = args.owc_definition
-        if args.owc_offset:
-            snap_conf.owc_offset = args.owc_offset
-        if args.delta:
-            snap_conf.delta_z = args.delta
+        for arg, field in _OVERRIDES:
+            value = getattr(args, arg)
+            if value:
+                setattr(snap_conf, field, value)
         return snap_conf
 
     def load_restart_file(self, config):
@@ -201,27 +278,30 @@ class SnapwellApp:
     @staticmethod
     def make_parser(prog):
         def snapwell_config_file(conf_file):
-            if not path.exists(conf_file):
+            try:
+                conf_stat = stat(conf_file)
+            except OSError as err:
                 raise argparse.ArgumentTypeError(
                     f"No such file or directory: {conf_file}"
-                )
+                ) from err
 
-            if not path.isfile(conf_file):
+            if not S_ISREG(conf_stat.st_mode):
                 raise argparse.ArgumentTypeError(
                     "A Snapwell config file is needed.  Provide full path to config file."
                 )
 
             logging.info("Parsing config file %s", conf_file)
             try:
-                with open(conf_file) as config_stream:
-                    config_dict = yaml.safe_load(config_stream)
-                    if not isinstance(config_dict, dict):
-                        raise ValueError(
-                            f"Wrong format in config file, expected root dictionary, but got {type(config_dict)}"
-                        )
-                    conf = SnapConfig(**config_dict)
-                    conf.set_base_path(path.dirname(conf_file))
-                    return conf
+                config_dict = deepcopy(
+                    _load_yaml(path.realpath(conf_file), conf_stat.st_mtime)
+                )
+                if not isinstance(config_dict, dict):
+                    raise ValueError(
+                        f"Wrong format in config file, expected root dictionary, but got {type(config_dict)}"
+                    )
+                conf = SnapConfig(**config_dict)
+                conf.set_base_path(path.dirname(conf_file))
+                return conf
             except Exception as err:
                 raise argparse.ArgumentTypeError(
                     f"Error while parsing snapwell config file: {err}"
@@ -301,32 +381,44 @@ class SnapwellApp:
             default=0.0,
             help="Allow a percentage of snaps to fail without application failing",
         )
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=positive_int,
+            default=1,
+            help="Number of processes snapping wells in parallel, e.g. 4",
+        )
         return parser
 
     def runner(self):
         config = self.load_config()
-        return SnapwellRunner(
+        runner = SnapwellRunner(
             config,
             self.load_grid_file(config),
             self.load_restart_file(config),
             self.load_permx(config),
-            config.wellpaths,
+            None,
             self.args.resinsight,
+            self.args.jobs,
         )
+        # wells are read as they are snapped, one that cannot be read counts
+        # as a failed well instead of stopping the run
+        runner.wellpaths = config.iter_wellpaths(errors=runner.errors)
+        return runner
 
 
 def run(app):
-    fullstart = time()
+    fullstart = perf_counter()
 
     runner = app.runner()
 
-    confstop = time()
+    confstop = perf_counter()
     conftime = round(confstop - fullstart, 2)
     logging.info("\n\nConfiguration completed in %s sec.\n", str(conftime))
 
     runner.main_loop()
 
-    fullstop = time()
+    fullstop = perf_counter()
     fullsec = round(fullstop - fullstart, 2)
     logging.info("snapwell completed in %s seconds", str(fullsec))
 
@@ -336,7 +428,8 @@ def run(app):
         )
         logging.error(error_msg)
 
-    if len(runner.errors) / len(runner.wellpaths) * 100.0 > app.args.allow_fail:
+    num_snaps = len(runner.config.wellpath_files)
+    if len(runner.errors) / num_snaps * 100.0 > app.args.allow_fail:
         # The users sometimes want the program to pass even though it failed at
         # snapping all wells
         return -1
@@ -13,38 +13,49 @@
 #  for more details.
 
 import logging
+import warnings
 from functools import wraps
-from math import inf, isinf, isnan
+from math import inf, isfinite
 from os.path import exists
 
+import numpy as np
 
-def finiteFloat(elt):
-    return not (isinf(elt) or isnan(elt))
+finiteFloat = isfinite
 
 
 def _ignorable_(line):
-    line = line.strip()
-    if not line or (len(line) >= 2 and line[:2] == "--"):
-        return True  # ignorable, yes
-    return False
+    """True if the stripped line (see strip_line) is empty or a comment."""
+    return not line or line.startswith("--")
 
 
 def token(f):
-    token = ""
-    while _ignorable_(token):
-        token = f.readline()
-        if not token:
-            return None
-        token = strip_line(token)
-    return token
+    """Returns the next non-empty, non-comment line of f, or None at EOF."""
+    for line in f:
+        line = strip_line(line)
+        if not _ignorable_(line):
+            return line
+    return None
 
 
 def strip_line(l):
     """strips string and replace tabs and multiple spaces with single space."""
-    l = l.replace("\t", " ")
-    while "  " in l:
-        l = l.replace("  ", " ")
-    return l.strip()
+    return " ".join(l.split())
+
+
+def _parse_rows(lines, num_columns):
+    """Parses the non-empty, non-comment lines as rows of num_columns floats."""
+    rows = []
+    for line in lines:
+        line = strip_line(line)
+        if _ignorable_(line):
+            continue
+        row = [float(e) for e in line.split()]
+        if len(row) != num_columns:
+            raise IndexError(
+                "Cannot insert %s into table of %d columns." % (row, num_columns)
+            )
+        rows.append(row)
+    return rows
 
 
 def takes_stream(i, mode):
@@ -63,10 +74,11 @@ def takes_stream(i, mode):
 
 
 class WellPath:
-    """A WellPath is essentially a dictionary of lists containing at the very least,
-    x (UTM), y (UTM), z (UTM, TVD), followed by an arbitrary amount of well
-    logs (specified in WellPath file), e.g. measured depth, inclination, and
-    azimuth.
+    """A WellPath is essentially a table with one column per header containing at
+    the very least, x (UTM), y (UTM), z (UTM, TVD), followed by an arbitrary
+    amount of well logs (specified in WellPath file), e.g. measured depth,
+    inclination, and azimuth.  The table is stored as one 2-D float array with
+    a row per wellpoint, the filled rows of a buffer with room for more rows.
 
     (This is essentially a very basic Excel file, with some minimal metadata.)
 
@@ -75,7 +87,8 @@ class WellPath:
     """
 
     def __init__(self, version=1.0, welltype="", wellname="", date=None, filename=None):
-        self._table = {"x": [], "y": [], "z": []}
+        self._data = np.empty((0, 3), dtype=np.float64)
+        self._col_idx = {"x": 0, "y": 1, "z": 2}
         self._version = version
         self.well_type = welltype
         self.well_name = wellname
@@ -92,6 +105,16 @@ class WellPath:
                 "WellPath file extension is .yaml.  Potentially a Snapwell config file."
             )
 
+    @property
+    def _data(self):
+        """The table, a view of the filled rows of the buffer."""
+        return self._buffer[: self._num_rows]
+
+    @_data.setter
+    def _data(self, data):
+        self._buffer = data
+        self._num_rows = len(data)
+
     @property
     def file_name(self):
         return self._filename
@@ -145,9 +168,9 @@ class WellPath:
         self._window_depth = float(depth)
 
     def add_column(self, header, data=None):
-        if not data:
+        if data is None:
             data = []
-        if header in self._table:
+        if header in self._col_idx:
             raise KeyError("Key %s exists in table." % header)
         lx = len(self)
         ld = len(data)
@@ -155,7 +178,9 @@ class WellPath:
             raise IndexError(
                 "Data needs to be of len(wp)=%d, was given %d entries." % (lx, ld)
             )
-        self._table[header] = data
+        column = np.asarray(data, dtype=np.float64).reshape(lx, 1)
+        self._data = np.concatenate([self._data, column], axis=1)
+        self._col_idx[header] = len(self.headers)
         self.headers.append(header)
 
     def remove_column(self, header):
@@ -164,28 +189,40 @@ class WellPath:
                 "Cannot delete column %s.  A WellPath must contain x, y, and z."
                 % str(header)
             )
-        if header in self._table:
-            del self._table[header]
+        if header in self._col_idx:
+            self._data = np.delete(self._data, self._col_idx[header], axis=1)
             hs = [h for h in self.headers if h != header]
             self.headers = hs
+            self._col_idx = {h: i for i, h in enumerate(hs)}
 
     def add_raw_row(self, row):
         """Adds a raw row, where row now is a list following header's order"""
-        if len(row) != len(self._table):
+        if len(row) != len(self.headers):
             raise IndexError(
-                "Cannot insert %s into table of %d columns." % (row, len(self._table))
+                "Cannot insert %s into table of %d columns." % (row, len(self.headers))
             )
-        idx = 0
-        for key in self.headers:
-            self._table[key].append(row[idx])
-            idx += 1
-
-        if len(self) == 1:
+        self._add_rows([row])
+
+    def _add_rows(self, rows):
+        """Adds all the raw rows in rows at once, each row following header's
+        order."""
+        if not len(rows):
+            return
+        data = np.asarray(rows, dtype=np.float64)
+        start = self._num_rows
+        end = start + len(data)
+        if end > len(self._buffer):
+            # grow by doubling, so that adding rows one by one is amortized O(1)
+            buffer = np.empty((max(end, 2 * len(self._buffer)), len(self.headers)))
+            buffer[:start] = self._data
+            self._buffer = buffer
+        self._buffer[start:end] = data
+        self._num_rows = end
+        if start == 0:
             self._update_rkb()
 
     def rows(self):
-        for i in range(len(self)):
-            yield [self._table[c][i] for c in self.headers]
+        yield from self._data.tolist()
 
     def _update_rkb(self):
         """Updates the RKB values to the correct ones, that is, rkb=(x, y, z_r) where x
@@ -199,10 +236,11 @@ class WellPath:
         """
         if len(self) == 0:
             return False
-        if "MD" not in self.headers:
+        if "MD" not in self._col_idx:
             return False
-        x, y = self._table["x"][0], self._table["y"][0]
-        tvd, md = self._table["z"][0], self._table["MD"][0]
+        first = self._data[0]
+        x, y = first[0], first[1]
+        tvd, md = first[2], first[self._col_idx["MD"]]
         if finiteFloat(md) and finiteFloat(tvd):
             self.rkb = (x, y, md - tvd)
             return True
@@ -210,7 +248,6 @@ class WellPath:
             return False
 
     def update(self, col, idx, elt):
-
         """Sets elt in the idx'th position of column col."""
         rs = len(self)
         cs = len(self.headers)
@@ -222,33 +259,32 @@ class WellPath:
                 raise IndexError("column index out of range, 0 <= col < %d" % cs)
             col = self.headers[col]
 
-        if col not in self.headers:
+        if col not in self._col_idx:
             raise KeyError("Key %s does not name a column" % str(col))
 
-        self._table[col][idx] = elt
+        self._data[idx, self._col_idx[col]] = elt
 
     def __getitem__(self, idx):
+        """The column named idx (a view, writes go to the table), or the
+        idx'th row as a list."""
         if isinstance(idx, str):
-            return self._table[idx]
-        return [self._table[key][idx] for key in self.headers]
+            return self._data[:, self._col_idx[idx]]
+        return self._data[idx].tolist()
 
     def __contains__(self, idx):
         if isinstance(idx, str):
-            return idx in self._table
-        return all(len(self._table[key]) > idx for key in self.headers)
+            return idx in self._col_idx
+        return len(self) > idx
 
     def __setitem__(self, idx, elt):
-        lx = len(self.headers)
-        ld = len(elt)
-        for i in range(min(lx, ld)):
-            h = self.headers[i]
-            self._table[h][idx] = elt[i]
+        n = min(len(self.headers), len(elt))
+        self._data[idx, :n] = elt[:n]
         if idx == 0:
             self._update_rkb()
 
     def __len__(self):
         """The number of rows, i.e., the number of wellpoints."""
-        return len(self._table["x"])
+        return self._num_rows
 
     def __str__(self):
         return self.well_name
@@ -303,13 +339,19 @@ class WellPath:
             header = token(f).split()[0]  # ignore unit,scale for now
             wp.add_column(header)
 
-        while True:  # loop-and-a-half
-            t = token(f)
-            if t is None:
-                break
-            data = [float(e) for e in t.split()]
-            wp.add_raw_row(data)
+        num_headers = len(wp.headers)
+        lines = f.read().splitlines()
         f.close()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)  # no rows
+                rows = np.loadtxt(lines, dtype=np.float64, comments="--", ndmin=2)
+        except ValueError:
+            rows = None
+        if rows is None or (len(rows) and rows.shape[1] != num_headers):
+            # malformed, parse line by line to report the offending row
+            rows = _parse_rows(lines, num_headers)
+        wp._add_rows(rows)
 
         return wp
 
@@ -318,33 +360,24 @@ class WellPath:
         result is the same as WellPath.write, but writes to the
         given stream.
         """
-        nl = "\n"
-
-        def fmt(s):
-            return "%.2f" % s
 
         if resinsight:
-            out.write(self.well_name)
-            out.write(nl)
-            for r in self.rows():
-                out.write(
-                    " ".join(map(fmt, r[:4])) + nl
-                )  # ResInsight wants only 'x y tvd md'
+            # ResInsight wants only 'x y tvd md'
+            lines = [self.well_name]
+            data = self._data[:, :4]
         else:
-            out.write(self._version)
-            out.write(nl)
-            out.write(self.well_type)
-            out.write(nl)
-            out.write(self.well_name)
-            out.write(" ")
-            out.write(" ".join(map(fmt, self._rkb)))
-            out.write(nl)
-            out.write(str(len(self.headers) - 3))
-            out.write(nl)
-            for i in range(3, len(self.headers)):
-                out.write(f"{self.headers[i]} 1 lin" + nl)
-            for r in self.rows():
-                out.write(" ".join(map(fmt, r)) + nl)
+            lines = [
+                self._version,
+                self.well_type,
+                "%s %.2f %.2f %.2f" % (self.well_name, *self._rkb),
+                str(len(self.headers) - 3),
+            ]
+            lines.extend(f"{h} 1 lin" for h in self.headers[3:])
+            data = self._data
+        row_fmt = " ".join(["%.2f"] * data.shape[1])
+        lines.extend(row_fmt % tuple(r) for r in data.tolist())
+        lines.append("")
+        out.write("\n".join(lines))
 
     def write(self, fname=None, overwrite=False, resinsight=False):
         """Opens fname and writes this object to file in the typical WellPath format
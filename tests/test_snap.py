@@ -2,6 +2,7 @@ import datetime
 from unittest.mock import MagicMock, create_autospec
 from itertools import product
 
+import numpy as np
 import pytest
 
 from snapwell.snapecl import snap
@@ -28,8 +29,8 @@ def homogeneous_grid(ni=3, nj=3, nk=3, x=1.0, y=1.0, z=1.0):
 
 @pytest.fixture()
 def well_path_mock():
-    def side_effect(idx):
-        return [(1.0, 1.0, 1.0), (2.0, 2.0, 2.0)][idx]
+    def side_effect(column):
+        return {"x": [1.0, 2.0], "y": [1.0, 2.0], "z": [1.0, 2.0]}[column]
 
     well_path = create_autospec(WellPath)
     well_path.owc_offset = 0.5
@@ -45,26 +46,31 @@ def test_snap_inside_grid(monkeypatch, well_path_mock, homogeneous_grid):
     grid, _, _ = homogeneous_grid
     eclkw_mock = MagicMock()
     eclkw_mock.__getitem__.return_value = 0.0
+    eclkw_mock.numpy_view.return_value = np.zeros(grid.getNumActive())
     monkeypatch.setattr(
         snapwell.snapecl, "findKeyword", MagicMock(return_value=eclkw_mock)
     )
     random_date = datetime.datetime(1998, 1, 1, 0, 0)
     snap(well_path_mock, grid, "EclFile", random_date, 0.5, keywords=["SWAT"])
 
-    well_path_mock.add_column.assert_called_once_with("SWAT", [0.0, 0.0])
+    well_path_mock.add_column.assert_called_once()
+    keyword, values = well_path_mock.add_column.call_args.args
+    assert keyword == "SWAT"
+    np.testing.assert_array_equal(values, [0.0, 0.0])
 
 
 def test_snap_outside_grid(monkeypatch, well_path_mock, homogeneous_grid):
     grid, _, _ = homogeneous_grid
     eclkw_mock = MagicMock()
     eclkw_mock.__getitem__.return_value = 0.0
+    eclkw_mock.numpy_view.return_value = np.zeros(grid.getNumActive())
     monkeypatch.setattr(
         snapwell.snapecl, "findKeyword", MagicMock(return_value=eclkw_mock)
     )
     random_date = datetime.datetime(1998, 1, 1, 0, 0)
 
-    def side_effect(idx):
-        return [(4.0, 4.0, 4.0), (4.0, 4.0, 5.0)][idx]
+    def side_effect(column):
+        return {"x": [4.0, 4.0], "y": [4.0, 4.0], "z": [4.0, 5.0]}[column]
 
     well_path_mock.__getitem__.side_effect = side_effect
     with pytest.raises(ValueError, match="Could not find the point"):
@@ -1,5 +1,6 @@
 import unittest.mock
 
+import numpy as np
 import pytest
 from ecl import EclTypeEnum
 from ecl.eclfile import Ecl3DKW, EclKW
@@ -12,46 +13,78 @@ from .testcase import TestCase
 
 def test_interpolate_from_zero_raises():
     with pytest.raises(IndexError, match="interpolate down"):
-        snapecl.interpolate(None, 0, None, None)
+        snapecl.interpolate(0, None, None)
+
+
+@pytest.mark.parametrize(
+    "p1, p2, expected",
+    [
+        ((0, 0), (3, 4), 5.0),
+        ((1, 2, 3), (1, 2, 3), 0.0),
+        ((0, 0, 0), (2, 3, 6), 7.0),
+        ((0, 0, 100), (3, 4), 5.0),
+    ],
+)
+def test_dist(p1, p2, expected):
+    assert snapecl.dist(p1, p2) == pytest.approx(expected)
 
 
 def test_no_threshold_returns_none():
-    assert snapecl.first_swat_below_treshold([(0, 0, 0, 0, 1)] * 100) is None
+    column = snapecl.Column(
+        0, 0, np.arange(100), np.arange(100), np.ones(100), np.ones(100)
+    )
+    assert snapecl.first_swat_below_treshold(column) is None
+
+
+def test_first_swat_below_threshold():
+    values = np.array([1.0, 0.9, 0.6, 0.8, 0.1])
+    column = snapecl.Column(0, 0, np.arange(5), np.arange(5), values, np.ones(5))
+    assert snapecl.first_swat_below_treshold(column) == 2
+    assert snapecl.first_swat_below_treshold(column, threshold=0.9) == 1
 
 
 def test_no_active_above_z_returns_none():
-    grid = unittest.mock.MagicMock()
-    grid.get_xyz.return_value = (1, 1, 1)
-    assert snapecl.find_center_z(grid, [[1] * 5] * 100, 0.0) is None
+    column = snapecl.Column(
+        0, 0, np.arange(100), np.arange(100), np.ones(100), np.ones(100)
+    )
+    assert snapecl.find_center_z(column, 0.0) is None
 
 
 def test_no_active_logs_warning(caplog):
-    grid = unittest.mock.MagicMock()
-    grid.get_xyz.return_value = (1, 1, 1)
-    grid.find_cell.return_value = (0, 0, 0)
-    grid.get_active_index.return_value = -1
-    snapecl.find_owc(grid, [0], 0, 0, 0)
+    grid = EclGridGenerator.createRectangular((1, 1, 2), (1, 1, 1), actnum=[0, 0])
+    snapecl.find_owc(grid, [], 0.5, 0.5, 0.5)
     assert any("No active cell for" in r.message for r in caplog.records)
 
 
 def test_no_treshold_logs_warning(caplog):
-    grid = unittest.mock.MagicMock()
-    grid.get_xyz.return_value = (1, 1, 1)
-    grid.find_cell.return_value = (0, 0, 0)
-    grid.get_active_index.return_value = 1
-    snapecl.find_owc(grid, [1, 1], 0, 0, 0)
+    grid = EclGridGenerator.createRectangular((1, 1, 2), (1, 1, 1))
+    snapecl.find_owc(grid, [1, 1], 0.5, 0.5, 0.5)
     assert any("No active cell has swat below" in r.message for r in caplog.records)
 
 
 def test_no_cell_above_logs_warning(caplog):
-    grid = unittest.mock.MagicMock()
-    grid.get_xyz.return_value = (1, 1, 1)
-    grid.find_cell.return_value = (0, 0, 0)
-    grid.get_active_index.return_value = 1
-    owc, tvd = snapecl.find_owc(grid, [1, 0.7], 0, 0, 0)
+    grid = EclGridGenerator.createRectangular((1, 1, 2), (1, 1, 1))
+    owc, tvd = snapecl.find_owc(grid, [1, 0.7], 0.5, 0.5, 0.5, owc_offset=10.0)
     assert any("Depth is above active" in r.message for r in caplog.records)
-    assert owc == 1
-    assert tvd == 1
+    assert owc == 1.5
+    assert tvd == 0.5
+
+
+def test_start_cell():
+    actnum = [1] * 27
+    actnum[2 * 9 + 2 * 3 + 1] = 0  # (1, 2, 2) is inactive
+    grid = EclGridGenerator.createRectangular((3, 3, 3), (1, 1, 1), actnum=actnum)
+    assert snapecl._start_cell(grid, 1.5, 2.5, 0.2) == (1, 2, 0)
+    assert snapecl._start_cell(grid, 1.2, 2.9, 2.9) == (1, 2, 1)
+    assert snapecl._start_cell(grid, 0.1, 0.1, 1.5) == (0, 0, 1)
+    # outside the grid, the closest column is used
+    assert snapecl._start_cell(grid, 5.0, -1.0, 2.5) == (2, 0, 2)
+    assert snapecl._grid_locator(grid) is snapecl._grid_locator(grid)
+
+
+def test_start_cell_without_active_cells():
+    grid = EclGridGenerator.createRectangular((1, 1, 2), (1, 1, 1), actnum=[0, 0])
+    assert snapecl._start_cell(grid, 0.5, 0.5, 0.5) is None
 
 
 def test_enter_snap_mode_no_depth_error():
@@ -61,6 +94,21 @@ def test_enter_snap_mode_no_depth_error():
         snapecl.in_snap_mode(False, wp, 0)
 
 
+@pytest.mark.parametrize(
+    "depth_type, window_depth, expected",
+    [(None, 0.0, 0), ("MD", 2.5, 2), ("MD", 10.0, 4), ("TVD", 0.0, 0)],
+)
+def test_snap_mode_start(depth_type, window_depth, expected):
+    wp = WellPath(wellname="my well", filename="test.w")
+    wp.add_column("MD")
+    wp.add_column("TVD")
+    for md in range(1, 5):
+        wp.add_raw_row([0.0, 0.0, float(md), float(md), float(md)])
+    wp.depth_type = depth_type
+    wp.window_depth = window_depth
+    assert snapecl._snap_mode_start(wp) == expected
+
+
 class SnapAlgorithmTest(TestCase):
     def setUp(self):
         self.epsilon = 0.0001
@@ -71,6 +71,12 @@ def test_set_base_path(init_config):
     assert same_path(join(conf_path, "restart.UNRST"), init_config.restart_file)
 
 
+def test_iter_wellpaths_reads_lazily(init_config):
+    wellpaths = init_config.iter_wellpaths()
+    with pytest.raises(IOError):
+        next(wellpaths)
+
+
 def test_wellpath_content(init_config):
     assert len(init_config.wellpath_files) == 2
 
@@ -1,7 +1,13 @@
+import gc
 import os
+import pickle
+import subprocess
+import sys
 import unittest
-from datetime import date
-from os.path import abspath, join
+import weakref
+from datetime import date, datetime
+from os.path import abspath, dirname, join
+from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -14,6 +20,16 @@ from snapwell import SnapConfig, findKeyword, findRestartStep, roundAwayFromEven
 from .testcase import TestCase
 
 
+def test_import_does_not_load_ecl():
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-c",
+            "import sys, snapwell.snapwell_main; assert 'ecl' not in sys.modules",
+        ]
+    )
+
+
 def test_keyword_out_of_range():
     restart = MagicMock()
     restart.num_report_steps.return_value = 100
@@ -21,6 +37,54 @@ def test_keyword_out_of_range():
         findKeyword("SWAT", restart, None, 100)
 
 
+def test_find_keyword_reads_keyword_once():
+    restart = MagicMock()
+    restart.num_report_steps.return_value = 10
+    assert findKeyword("SWAT", restart, None, 1) is findKeyword(
+        "SWAT", restart, None, 1
+    )
+    restart.iget_named_kw.assert_called_once_with("SWAT", 1)
+
+
+def test_find_keyword_caches_per_step_and_file():
+    restart, other = MagicMock(), MagicMock()
+    for f in restart, other:
+        f.num_report_steps.return_value = 10
+        f.iget_named_kw.side_effect = lambda kw, step: MagicMock()
+    assert findKeyword("SWAT", restart, None, 1) is not findKeyword(
+        "SWAT", restart, None, 2
+    )
+    assert findKeyword("SWAT", restart, None, 1) is not findKeyword(
+        "SWAT", other, None, 1
+    )
+
+
+def test_find_keyword_does_not_keep_restart_alive():
+    restart = EclFile(join(dirname(__file__), "testdata", "eclipse", "SPE3CASE1.UNRST"))
+    findKeyword("SWAT", restart, None, 1)
+    restart_ref = weakref.ref(restart)
+    del restart
+    gc.collect()
+    assert restart_ref() is None
+
+
+def test_restart_step_single_report_step():
+    restart = MagicMock()
+    restart.num_report_steps.return_value = 1
+    restart.iget_restart_sim_time.return_value = datetime(2000, 1, 1)
+    assert findRestartStep(restart, date(2010, 1, 1)) == 0
+
+
+def test_restart_step_reads_few_report_steps():
+    restart = MagicMock()
+    restart.num_report_steps.return_value = 1000
+    restart.iget_restart_sim_time.side_effect = lambda step: datetime(
+        2000 + step // 12, step % 12 + 1, 1
+    )
+    assert findRestartStep(restart, date(2050, 6, 15)) == 605
+    assert restart.iget_restart_sim_time.call_count < 20
+
+
 class SnapwellUtilTest(TestCase):
     def setUp(self):
         self._base = "testdata/snapwell"
@@ -72,6 +136,11 @@ class SnapwellUtilTest(TestCase):
         self.assertBetween(0.1, (rx % 2.0), 1.9)
         self.assertAlmostEqual(x, rx, delta=0.1)
 
+        self.assertAlmostEqual(1556.1, roundAwayFromEven(1556.0))
+        self.assertAlmostEqual(1559.9, roundAwayFromEven(1559.95))
+        self.assertAlmostEqual(-1556.1, roundAwayFromEven(-1556.05))
+        self.assertAlmostEqual(-1557.9, roundAwayFromEven(-1558.0 + 0.05))
+
         x = 1497.0
         for i in range(160):
             rx = roundAwayFromEven(x)
@@ -110,6 +179,27 @@ class SnapwellTest(TestCase):
 
         self.assertIsNotNone(snap.grid)
         self.assertIsNotNone(snap.restart)
+        self.assertIs(snap.grid, snap.grid)
+        self.assertIs(snap.restart, snap.restart)
+
+        grid = snap.grid
+        snap.clear_cache()
+        self.assertIsNot(grid, snap.grid)
+
+        # wellpaths are changed in place by snap, so each access reads them anew
+        self.assertIsNot(snap.wellpaths[0], snap.wellpaths[0])
+
+        grid, restart = snap.grid, snap.restart
+        snap.grid_file = Path("SPE3CASE1.EGRID")
+        snap.set_base_path(self._ecl_base)
+        self.assertEqualPaths(gridfile, snap.grid_file)
+        self.assertIsNot(grid, snap.grid)
+        self.assertIs(restart, snap.restart)
+
+        unpickled = pickle.loads(pickle.dumps(snap))
+        self.assertNotIn("grid", vars(unpickled))
+        self.assertEqualPaths(gridfile, unpickled.grid_file)
+        self.assertIsNotNone(unpickled.grid)
 
 
 if __name__ == "__main__":
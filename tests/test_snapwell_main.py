@@ -3,6 +3,7 @@ from os import path
 from pathlib import Path
 from unittest.mock import MagicMock
 import argparse
+import logging
 import yaml
 import pytest
 import snapwell
@@ -40,6 +41,13 @@ def test_run_missing(capsys, tmp_path):
     assert "No such file" in capsys.readouterr().err
 
 
+def test_run_directory(capsys, tmp_path):
+    with pytest.raises(SystemExit) as e:
+        swm.SnapwellApp(["snapwell", str(tmp_path)])
+    assert e.value.code == 2
+    assert "config file is needed" in capsys.readouterr().err
+
+
 def test_missing_config_grid(capsys, tmp_path):
     config_file_path = path.join(tmp_path, "config.yaml")
 
@@ -108,6 +116,25 @@ def test_config_sets_correct_paths(tmp_path):
     assert not config.overwrite
 
 
+def test_reparsed_config_is_not_shared(tmp_path):
+    config_file_path = path.join(tmp_path, "config.yaml")
+    write_config(config_file_path)
+
+    first = swm.SnapwellApp(["snapwell", config_file_path, "-z", "2.0"]).load_config()
+    second = swm.SnapwellApp(["snapwell", config_file_path]).load_config()
+    assert first.owc_offset == 2.0
+    assert second.owc_offset == 0.5
+    assert first.wellpath_files is not second.wellpath_files
+
+
+def test_commandline_delta(tmp_path):
+    config_file_path = path.join(tmp_path, "config.yaml")
+    write_config(config_file_path)
+
+    config = swm.SnapwellApp(["snapwell", config_file_path, "-d", "0.02"]).load_config()
+    assert config.delta_z == 0.02
+
+
 @pytest.mark.parametrize("overwrite_keyword", ["-w", "--overwrite"])
 def test_overwrite(tmp_path, overwrite_keyword):
     config_file_path = path.join(tmp_path, "config.yaml")
@@ -125,8 +152,9 @@ def test_runner_correct_wellpaths():
     runner = swm.SnapwellApp(
         ["snapwell", path.join(test_data_path, "test.yaml")]
     ).runner()
-    assert len(runner.wellpaths) == 1
-    wp = runner.wellpaths[0]
+    wellpaths = list(runner.wellpaths)
+    assert len(wellpaths) == 1
+    wp = wellpaths[0]
     assert wp.well_type == "A - B"
     rows = list(wp.rows())
     assert len(rows) == 4
@@ -143,6 +171,57 @@ def test_run_test_data_exits_with_zero(config_file):
     )
 
 
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_unreadable_well_counts_as_failed(tmpdir, jobs):
+    config = {
+        "grid_file": path.join(test_data_path, "../eclipse/SPE3CASE1.EGRID"),
+        "restart_file": path.join(test_data_path, "../eclipse/SPE3CASE1.UNRST"),
+        "wellpath_files": [
+            {"well_file": path.join(test_data_path, "well1.w"), "date": "2025-1-1"},
+            {"well_file": "missing.w", "date": "2025-1-1"},
+        ],
+    }
+    with tmpdir.as_cwd():
+        with open("config_file.yaml", "w") as fout:
+            yaml.dump(config, fout)
+        runner = swm.SnapwellApp(["snapwell", "config_file.yaml", "-j", jobs]).runner()
+        runner.main_loop()
+        assert len(runner.errors) == 1
+        assert "Failed to read well path" in runner.errors[0]
+        assert "missing.w" in runner.errors[0]
+        assert tmpdir.join("TEST_WELL1.out").exists()
+
+
+def test_run_in_parallel_gives_same_errors(valid_config):
+    def run_errors(*args):
+        runner = swm.SnapwellApp(["snapwell", valid_config, "-w", *args]).runner()
+        runner.main_loop()
+        return runner.errors
+
+    errors = run_errors()
+    assert len(errors) == 1
+    assert run_errors("--jobs", "2") == errors
+
+
+def test_worker_shares_grid_but_reopens_restart(monkeypatch, valid_config):
+    monkeypatch.setattr(swm, "_worker_runner", None)
+    config = swm.SnapwellApp(["snapwell", valid_config]).load_config()
+    grid, restart = config.grid, config.restart
+    swm._init_worker(config, False)
+    assert swm._worker_runner.grid is grid
+    assert swm._worker_runner.restart is not restart
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1", "two"])
+def test_invalid_jobs(capsys, jobs):
+    with pytest.raises(SystemExit) as e:
+        swm.SnapwellApp(
+            ["snapwell", path.join(test_data_path, "test.yaml"), "-j", jobs]
+        )
+    assert e.value.code == 2
+    assert "jobs" in capsys.readouterr().err
+
+
 def test_missing_init_gives_error(capsys, tmp_path):
     config_file_path = path.join(tmp_path, "config.yaml")
 
@@ -179,6 +258,21 @@ def test_commandline_owc_defintion_malformed_owc_defnition(capsys, owc_def):
     assert "owc definition" in capsys.readouterr().err
 
 
+def test_duplicate_filter(capsys):
+    duplicate_filter = swm.DuplicateFilter()
+
+    def record(msg):
+        return logging.LogRecord("snapwell", logging.WARNING, "", 0, msg, (), None)
+
+    assert duplicate_filter.filter(record("first"))
+    assert not duplicate_filter.filter(record("first"))
+    assert not duplicate_filter.filter(record("first"))
+    assert duplicate_filter.filter(record("second"))
+    assert "Suppressed 3 similar messages" in capsys.readouterr().out
+    duplicate_filter.reset_count()
+    assert duplicate_filter.filter(record("second"))
+
+
 @pytest.mark.parametrize("input_val", [0, 0.0, 10, 10.0, 100, 100.0])
 def test_percentage(input_val):
     swm.percentage(input_val) == float(input_val)
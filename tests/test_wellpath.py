@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 
 from snapwell import WellPath
+from snapwell.wellpath import strip_line, token
 
 from .testcase import TestCase
 
@@ -46,11 +47,69 @@ def test_well_path_update():
         wp.update(4, 0, 0)
 
 
+def test_well_path_column_is_view():
+    wp = WellPath(filename="well.w")
+    wp.add_raw_row([1, 1, 1])
+    wp.add_raw_row([2, 2, 2])
+    wp["z"][1] = 3
+    assert wp[1] == [2, 2, 3]
+
+
+def test_well_path_add_raw_rows_grows_buffer_geometrically():
+    wp = WellPath(filename="well.w")
+    buffer, grown = wp._buffer, 0
+    for i in range(1000):
+        wp.add_raw_row([i, i, i])
+        if wp._buffer is not buffer:
+            buffer, grown = wp._buffer, grown + 1
+    assert grown <= 11
+    assert wp["z"].tolist() == list(range(1000))
+    wp.add_column("MD", range(1000))
+    assert wp[999] == [999, 999, 999, 999]
+
+
+def test_parse_wrong_row_length():
+    with pytest.raises(IndexError, match="Cannot insert"):
+        WellPath.parse(StringIO("1.0.0\nA - B\nname 0 0 0\n0\n1 2 3\n1 2\n"))
+
+
+def test_parse_skips_comments_in_rows():
+    wp = WellPath.parse(
+        StringIO("1.0.0\nA - B\nname 0 0 0\n0\n1 2\t3\n\n-- comment\n 4 5 6 \n")
+    )
+    assert list(wp.rows()) == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_parse_no_rows():
+    wp = WellPath.parse(StringIO("1.0.0\nA - B\nname 0 0 0\n1\nMD 1 lin\n"))
+    assert len(wp) == 0
+    assert wp.headers == ["x", "y", "z", "MD"]
+
+
 def test_parse_wrong_num_columns():
     with pytest.raises(ValueError, match="<num_logs>"):
         WellPath.parse(StringIO("1.0.0\nA - B\nname 0 0 0\nnumber_of_columns\n"))
 
 
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("", ""),
+        ("  a  ", "a"),
+        ("a\t\tb     c\n", "a b c"),
+        ("\t 1.0 \t  2.0\t3.0 ", "1.0 2.0 3.0"),
+    ],
+)
+def test_strip_line(line, expected):
+    assert strip_line(line) == expected
+
+
+def test_token_skips_comments_and_blank_lines():
+    stream = StringIO("\n-- comment\n   \n\t--indented comment\n a \t b\n\n")
+    assert token(stream) == "a b"
+    assert token(stream) is None
+
+
 def test_write_unspecified_file():
     wp = WellPath(filename=None)
     with pytest.raises(ValueError, match="file_name is unspecified"):